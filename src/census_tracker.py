@@ -3,34 +3,53 @@
 
 from __future__ import annotations
 import argparse
+import atexit
 import json
+import os
 import sqlite3
-from dataclasses import dataclass, asdict
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator, TextIO
 
-GREEN = "\033[0;32m"
-RED = "\033[0;31m"
-CYAN = "\033[0;36m"
-YELLOW = "\033[1;33m"
-BLUE = "\033[0;34m"
-BOLD = "\033[1m"
-NC = "\033[0m"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_COLOR = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+
+GREEN = "\033[0;32m" if _COLOR else ""
+RED = "\033[0;31m" if _COLOR else ""
+CYAN = "\033[0;36m" if _COLOR else ""
+YELLOW = "\033[1;33m" if _COLOR else ""
+BLUE = "\033[0;34m" if _COLOR else ""
+BOLD = "\033[1m" if _COLOR else ""
+NC = "\033[0m" if _COLOR else ""
 
 DB_PATH = Path.home() / ".blackroad" / "census-tracker.db"
+SQLITE_MAX_VARIABLE_NUMBER = 999
+DISTRICT_ID_CACHE_SIZE = 1024
+FETCH_BATCH_SIZE = 256
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class District:
     id: int
     name: str
     region: str
     area_sqkm: float
     district_type: str
-    created_at: str
+    created_at: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CensusRecord:
     id: int
     district_id: int
@@ -40,11 +59,11 @@ class CensusRecord:
     avg_age: float
     median_income: float
     unemployment_rate: float
-    collected_at: str
+    collected_at: int
     notes: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PopulationSummary:
     district_name: str
     region: str
@@ -58,52 +77,256 @@ class PopulationSummary:
     yoy_growth: float
 
 
+DISTRICT_COLUMNS = ",".join(f.name for f in fields(District))
+
+_SQL_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA analysis_limit=400;
+"""
+
+_SQL_CREATE_TABLES = {
+    "districts": """
+    CREATE TABLE IF NOT EXISTS districts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        region TEXT DEFAULT 'unknown',
+        area_sqkm REAL DEFAULT 0,
+        district_type TEXT DEFAULT 'urban',
+        created_at INTEGER NOT NULL
+    );
+""",
+    "census_records": """
+    CREATE TABLE IF NOT EXISTS census_records (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        district_id INTEGER NOT NULL REFERENCES districts(id),
+        year INTEGER NOT NULL,
+        population INTEGER DEFAULT 0,
+        households INTEGER DEFAULT 0,
+        avg_age REAL DEFAULT 0,
+        median_income REAL DEFAULT 0,
+        unemployment_rate REAL DEFAULT 0,
+        collected_at INTEGER NOT NULL,
+        notes TEXT DEFAULT '',
+        UNIQUE(district_id, year)
+    );
+""",
+}
+
+_SQL_INDEXES = """
+    CREATE INDEX IF NOT EXISTS idx_districts_region
+        ON districts(region);
+    DROP INDEX IF EXISTS idx_census_district;
+    CREATE INDEX IF NOT EXISTS idx_census_cover
+        ON census_records(district_id, year DESC, population, households,
+                          avg_age, median_income, unemployment_rate);
+"""
+
+_SQL_OPTIMIZE = "PRAGMA optimize"
+_SQL_ANALYZE_DISTRICTS = "ANALYZE districts"
+_SQL_ANALYZE_CENSUS = "ANALYZE census_records"
+_SQL_INDEX_EXISTS = "SELECT 1 FROM sqlite_master WHERE type='index' AND name=?"
+# Pre-epoch databases stored these columns as ISO-8601 TEXT in local time.
+TIMESTAMP_COLUMNS = (("districts", "created_at"), ("census_records", "collected_at"))
+_SQL_EPOCH = "CAST(strftime('%s', {0}, 'utc') AS INTEGER)"
+_SQL_COUNT_UNPARSEABLE = "SELECT COUNT(*) FROM {table} WHERE strftime('%s', {column}, 'utc') IS NULL"
+# Rebuild rather than ALTER COLUMN so a migrated table matches a fresh one
+# exactly; legacy_alter_table keeps census_records' REFERENCES districts
+# pointing at the new table.
+_SQL_MIGRATE_TIMESTAMP = """
+    PRAGMA legacy_alter_table=ON;
+    BEGIN;
+    ALTER TABLE {table} RENAME TO {table}_legacy;
+    {create}
+    INSERT INTO {table} ({columns}) SELECT {converted} FROM {table}_legacy;
+    DROP TABLE {table}_legacy;
+    COMMIT;
+    PRAGMA legacy_alter_table=OFF;
+"""
+_SQL_INSERT_DISTRICT = (
+    "INSERT INTO districts (name,region,area_sqkm,district_type,created_at)"
+    " VALUES (?,?,?,?,?)"
+)
+_SQL_SELECT_DISTRICT_ID = "SELECT id FROM districts WHERE name=?"
+_SQL_SELECT_DISTRICT_IDS = "SELECT id, name FROM districts WHERE name IN ({})"
+_SQL_LIST_DISTRICTS = f"SELECT {DISTRICT_COLUMNS} FROM districts ORDER BY id LIMIT ? OFFSET ?"
+_SQL_LIST_DISTRICTS_BY_REGION = (
+    f"SELECT {DISTRICT_COLUMNS} FROM districts WHERE region=? ORDER BY id LIMIT ? OFFSET ?"
+)
+_SQL_UPSERT_CENSUS = (
+    "INSERT INTO census_records"
+    " (district_id,year,population,households,avg_age,"
+    "  median_income,unemployment_rate,collected_at,notes)"
+    " VALUES (?,?,?,?,?,?,?,?,?)"
+    " ON CONFLICT(district_id, year) DO UPDATE SET"
+    " population=excluded.population, households=excluded.households,"
+    " avg_age=excluded.avg_age, median_income=excluded.median_income,"
+    " unemployment_rate=excluded.unemployment_rate,"
+    " collected_at=excluded.collected_at, notes=excluded.notes"
+)
+_SQL_UPSERT_CENSUS_RETURNING_ID = _SQL_UPSERT_CENSUS + " RETURNING id"
+_SQL_SELECT_SUMMARY = (
+    "SELECT d.name, d.region, d.area_sqkm, c.year, c.population,"
+    " c.households, c.avg_age, c.median_income, c.unemployment_rate,"
+    " LAG(c.population) OVER (ORDER BY c.year)"
+    " FROM districts d"
+    " LEFT JOIN census_records c ON c.district_id=d.id"
+    " WHERE d.name=? ORDER BY c.year DESC LIMIT 1"
+)
+_SQL_REGIONAL_REPORT = (
+    "SELECT COUNT(*), COUNT(c.id),"
+    " COALESCE(SUM(c.population),0), COALESCE(SUM(c.households),0),"
+    " COALESCE(SUM(CASE WHEN d.area_sqkm>0 THEN c.population END),0),"
+    " COALESCE(SUM(CASE WHEN c.id IS NOT NULL AND d.area_sqkm>0 THEN d.area_sqkm END),0),"
+    " COALESCE(SUM(CASE WHEN p.id IS NOT NULL THEN c.population END),0),"
+    " COALESCE(SUM(p.population),0)"
+    " FROM districts d"
+    " LEFT JOIN census_records c INDEXED BY idx_census_cover"
+    "  ON c.district_id=d.id AND c.year="
+    "  (SELECT MAX(year) FROM census_records WHERE district_id=d.id)"
+    " LEFT JOIN census_records p INDEXED BY idx_census_cover"
+    "  ON p.district_id=d.id AND p.year="
+    "  (SELECT MAX(year) FROM census_records WHERE district_id=d.id AND year<c.year)"
+    " WHERE d.region=?"
+)
+_SQL_STATUS = (
+    "SELECT (SELECT COUNT(*) FROM districts), COUNT(*), MIN(year), MAX(year)"
+    " FROM census_records"
+)
+_SQL_EXPORT_TIMESTAMP = "strftime('%Y-%m-%dT%H:%M:%S', {0}, 'unixepoch', 'localtime') AS {0}"
+
+
+def _export_select(table: str, cls: type) -> str:
+    """Build an export SELECT for ``table`` with columns in ``cls`` field order.
+
+    Columns are listed explicitly so export keys never depend on the table's
+    physical column order; stored epoch seconds are rendered as local
+    ISO-8601, like ``exported_at``.
+    """
+    columns = []
+    for f in fields(cls):
+        if (table, f.name) in TIMESTAMP_COLUMNS:
+            columns.append(_SQL_EXPORT_TIMESTAMP.format(f.name))
+        else:
+            columns.append(f.name)
+    return f"SELECT {','.join(columns)} FROM {table} ORDER BY id"
+
+
+_SQL_EXPORT = {
+    "districts": _export_select("districts", District),
+    "census_records": _export_select("census_records", CensusRecord),
+}
+
+
 class CensusTracker:
     """Population census data collection and analysis engine."""
 
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        self._lock = threading.Lock()
+        self._id_cache: OrderedDict[str, int] = OrderedDict()
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                     check_same_thread=False, cached_statements=256)
+        try:
+            self._init_db()
+        except Exception:
+            self._conn.close()
+            self._conn = None
+            raise
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection, serialising access across threads."""
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.ProgrammingError("CensusTracker is closed")
+            yield self._conn
+
+    def _cache_district_id(self, name: str, district_id: int) -> None:
+        self._id_cache[name] = district_id
+        self._id_cache.move_to_end(name)
+        if len(self._id_cache) > DISTRICT_ID_CACHE_SIZE:
+            self._id_cache.popitem(last=False)
+
+    def _district_id(self, conn: sqlite3.Connection, name: str) -> int | None:
+        """Resolve a district name to its id, consulting the LRU cache first."""
+        if name in self._id_cache:
+            self._id_cache.move_to_end(name)
+            return self._id_cache[name]
+        row = conn.execute(_SQL_SELECT_DISTRICT_ID, (name,)).fetchone()
+        if row:
+            self._cache_district_id(name, row[0])
+            return row[0]
+        return None
+
+    def close(self) -> None:
+        """Refresh planner statistics and close the underlying database connection.
+
+        Safe to call more than once.
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(_SQL_OPTIMIZE)
+            finally:
+                self._conn.close()
+                self._conn = None
 
     def _init_db(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS districts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE,
-                    region TEXT DEFAULT 'unknown',
-                    area_sqkm REAL DEFAULT 0,
-                    district_type TEXT DEFAULT 'urban',
-                    created_at TEXT NOT NULL
-                );
-                CREATE TABLE IF NOT EXISTS census_records (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    district_id INTEGER NOT NULL REFERENCES districts(id),
-                    year INTEGER NOT NULL,
-                    population INTEGER DEFAULT 0,
-                    households INTEGER DEFAULT 0,
-                    avg_age REAL DEFAULT 0,
-                    median_income REAL DEFAULT 0,
-                    unemployment_rate REAL DEFAULT 0,
-                    collected_at TEXT NOT NULL,
-                    notes TEXT DEFAULT '',
-                    UNIQUE(district_id, year)
-                );
-                CREATE INDEX IF NOT EXISTS idx_census_district
-                    ON census_records(district_id, year);
-            """)
+        with self._connect() as conn:
+            conn.executescript(_SQL_PRAGMAS)
+            indexed = conn.execute(_SQL_INDEX_EXISTS, ("idx_districts_region",)).fetchone()
+            for create in _SQL_CREATE_TABLES.values():
+                conn.executescript(create)
+            self._migrate_timestamps(conn)
+            conn.executescript(_SQL_INDEXES)
+            if not indexed:
+                conn.execute(_SQL_ANALYZE_DISTRICTS)
+
+    def _migrate_timestamps(self, conn: sqlite3.Connection) -> None:
+        """Convert legacy TEXT timestamp columns to INTEGER unix seconds.
+
+        Raises ValueError, leaving the table untouched, if any stored value is
+        not a timestamp SQLite can parse.
+        """
+        for table, column in TIMESTAMP_COLUMNS:
+            info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+            if {r[1]: r[2] for r in info}[column].upper() != "TEXT":
+                continue
+            bad = conn.execute(
+                _SQL_COUNT_UNPARSEABLE.format(table=table, column=column)
+            ).fetchone()[0]
+            if bad:
+                raise ValueError(
+                    f"Cannot migrate {table}.{column}: {bad} value(s) are not ISO-8601 timestamps"
+                )
+            columns = [r[1] for r in info]
+            converted = [_SQL_EPOCH.format(c) if c == column else c for c in columns]
+            try:
+                conn.executescript(_SQL_MIGRATE_TIMESTAMP.format(
+                    table=table, create=_SQL_CREATE_TABLES[table],
+                    columns=",".join(columns), converted=",".join(converted),
+                ))
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                conn.execute("PRAGMA legacy_alter_table=OFF")
+                raise
 
     def add_district(self, name: str, region: str = "unknown",
                      area_sqkm: float = 0, district_type: str = "urban") -> District:
         """Register a census district."""
-        with sqlite3.connect(self.db_path) as conn:
-            now = datetime.now().isoformat()
+        with self._connect() as conn:
+            now = int(time.time())
             cur = conn.execute(
-                "INSERT INTO districts (name,region,area_sqkm,district_type,created_at)"
-                " VALUES (?,?,?,?,?)",
-                (name, region, area_sqkm, district_type, now),
+                _SQL_INSERT_DISTRICT, (name, region, area_sqkm, district_type, now),
             )
+            self._cache_district_id(name, cur.lastrowid)
             return District(cur.lastrowid, name, region, area_sqkm, district_type, now)
 
     def record_census(self, district_name: str, year: int, population: int,
@@ -111,116 +334,187 @@ class CensusTracker:
                       median_income: float = 0.0, unemployment_rate: float = 0.0,
                       notes: str = "") -> CensusRecord:
         """Record census data for a district and year."""
-        with sqlite3.connect(self.db_path) as conn:
-            d = conn.execute(
-                "SELECT id FROM districts WHERE name=?", (district_name,)
-            ).fetchone()
-            if not d:
+        with self._connect() as conn:
+            district_id = self._district_id(conn, district_name)
+            if district_id is None:
                 raise ValueError(f"District '{district_name}' not found")
-            now = datetime.now().isoformat()
-            cur = conn.execute(
-                "INSERT OR REPLACE INTO census_records"
-                " (district_id,year,population,households,avg_age,"
-                "  median_income,unemployment_rate,collected_at,notes)"
-                " VALUES (?,?,?,?,?,?,?,?,?)",
-                (d[0], year, population, households, avg_age,
+            now = int(time.time())
+            record_id = conn.execute(
+                _SQL_UPSERT_CENSUS_RETURNING_ID,
+                (district_id, year, population, households, avg_age,
                  median_income, unemployment_rate, now, notes),
-            )
-            return CensusRecord(cur.lastrowid, d[0], year, population, households,
+            ).fetchone()[0]
+            return CensusRecord(record_id, district_id, year, population, households,
                                 avg_age, median_income, unemployment_rate, now, notes)
 
-    def list_districts(self, region: str = None) -> list:
-        """Return districts optionally filtered by region."""
-        with sqlite3.connect(self.db_path) as conn:
+    def record_census_bulk(self, rows: Iterable[tuple]) -> int:
+        """Record many census rows in one transaction.
+
+        Each row follows the positional order of ``record_census``
+        (district_name, year, population, households, avg_age, median_income,
+        unemployment_rate, notes); trailing fields may be omitted. Later rows
+        for the same district and year win, and every row in the batch shares
+        one ``collected_at`` timestamp. Returns the number of rows written.
+        """
+        defaults = (0, 0.0, 0.0, 0.0, "")
+        padded = []
+        for r in rows:
+            r = tuple(r)
+            if not 3 <= len(r) <= 3 + len(defaults):
+                raise ValueError(
+                    f"Census row must have 3 to {3 + len(defaults)} fields, got {len(r)}: {r!r}"
+                )
+            padded.append(r + defaults[len(r) - 3:])
+        if not padded:
+            return 0
+        names = list(dict.fromkeys(r[0] for r in padded))
+        with self._connect() as conn:
+            ids = {n: self._id_cache[n] for n in names if n in self._id_cache}
+            unresolved = [n for n in names if n not in ids]
+            for i in range(0, len(unresolved), SQLITE_MAX_VARIABLE_NUMBER):
+                chunk = unresolved[i:i + SQLITE_MAX_VARIABLE_NUMBER]
+                for did, name in conn.execute(
+                    _SQL_SELECT_DISTRICT_IDS.format(",".join("?" * len(chunk))), chunk,
+                ):
+                    ids[name] = did
+                    self._cache_district_id(name, did)
+            missing = [n for n in names if n not in ids]
+            if missing:
+                raise ValueError(f"District '{missing[0]}' not found")
+            now = int(time.time())
+            latest = {}
+            for name, year, *values in padded:
+                key = (ids[name], year)
+                latest.pop(key, None)
+                latest[key] = (*key, *values[:5], now, values[5])
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(_SQL_UPSERT_CENSUS, latest.values())
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            conn.execute(_SQL_ANALYZE_CENSUS)
+        return len(latest)
+
+    def list_districts(self, region: str = None, limit: int = None,
+                       offset: int = 0) -> Iterator[District]:
+        """Yield districts in id order, optionally filtered by region and paged."""
+        page = (-1 if limit is None else limit, offset)
+        with self._connect() as conn:
             if region:
-                rows = conn.execute(
-                    "SELECT * FROM districts WHERE region=?", (region,)
-                ).fetchall()
+                cur = conn.execute(_SQL_LIST_DISTRICTS_BY_REGION, (region, *page))
             else:
-                rows = conn.execute("SELECT * FROM districts").fetchall()
-            return [District(*r) for r in rows]
+                cur = conn.execute(_SQL_LIST_DISTRICTS, page)
+        while True:
+            with self._lock:
+                rows = cur.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                return
+            for r in rows:
+                yield District(*r)
 
     def get_summary(self, district_name: str) -> PopulationSummary:
         """Build a population summary with YoY growth for the latest census year."""
-        with sqlite3.connect(self.db_path) as conn:
-            d = conn.execute(
-                "SELECT * FROM districts WHERE name=?", (district_name,)
-            ).fetchone()
-            if not d:
-                raise ValueError(f"District '{district_name}' not found")
-            district = District(*d)
-            rows = conn.execute(
-                "SELECT * FROM census_records WHERE district_id=? ORDER BY year DESC LIMIT 2",
-                (district.id,),
-            ).fetchall()
-
-        if not rows:
+        with self._connect() as conn:
+            row = conn.execute(_SQL_SELECT_SUMMARY, (district_name,)).fetchone()
+        if not row:
+            raise ValueError(f"District '{district_name}' not found")
+        (name, region, area_sqkm, year, population, households,
+         avg_age, median_income, unemployment_rate, prev_pop) = row
+        if year is None:
             raise ValueError(f"No census data for '{district_name}'")
 
-        latest = CensusRecord(*rows[0])
-        density = (latest.population / district.area_sqkm) if district.area_sqkm > 0 else 0
+        density = (population / area_sqkm) if area_sqkm > 0 else 0
         yoy = 0.0
-        if len(rows) > 1:
-            prev = CensusRecord(*rows[1])
-            if prev.population > 0:
-                yoy = round((latest.population - prev.population) / prev.population * 100, 2)
+        if prev_pop is not None and prev_pop > 0:
+            yoy = round((population - prev_pop) / prev_pop * 100, 2)
 
         return PopulationSummary(
-            district.name, district.region, latest.year, latest.population,
-            latest.households, round(density, 1), latest.avg_age,
-            latest.median_income, latest.unemployment_rate, yoy,
+            name, region, year, population, households, round(density, 1),
+            avg_age, median_income, unemployment_rate, yoy,
         )
 
     def regional_report(self, region: str) -> dict:
-        """Aggregate census stats across all districts in a region."""
-        districts = self.list_districts(region)
+        """Aggregate census stats across all districts in a region.
+
+        Density covers districts with a known area; YoY growth compares each
+        district's latest census with its previous one, where it has one.
+        """
+        with self._connect() as conn:
+            (districts, count, total_pop, total_hh, area_pop, area,
+             growth_pop, prev_pop) = conn.execute(_SQL_REGIONAL_REPORT, (region,)).fetchone()
         if not districts:
             return {"region": region, "districts": 0}
-        total_pop = 0
-        total_hh = 0
-        count = 0
-        for d in districts:
-            try:
-                s = self.get_summary(d.name)
-                total_pop += s.population
-                total_hh += s.households
-                count += 1
-            except ValueError:
-                continue
         return {
             "region": region,
             "districts_with_data": count,
             "total_population": total_pop,
             "total_households": total_hh,
             "avg_household_size": round(total_pop / total_hh, 2) if total_hh else 0,
+            "density_per_sqkm": round(area_pop / area, 1) if area else 0,
+            "yoy_growth": round((growth_pop - prev_pop) / prev_pop * 100, 2) if prev_pop > 0 else 0.0,
         }
 
     def status(self) -> dict:
         """High-level statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            districts = conn.execute("SELECT COUNT(*) FROM districts").fetchone()[0]
-            records = conn.execute("SELECT COUNT(*) FROM census_records").fetchone()[0]
-            years = conn.execute(
-                "SELECT MIN(year), MAX(year) FROM census_records"
-            ).fetchone()
+        with self._connect() as conn:
+            districts, records, first, last = conn.execute(_SQL_STATUS).fetchone()
         return {
             "districts": districts,
             "census_records": records,
-            "year_range": f"{years[0]}–{years[1]}" if years[0] else "none",
+            "year_range": f"{first}–{last}" if first else "none",
             "db_path": str(self.db_path),
         }
 
+    @contextmanager
+    def _export_snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Yield the connection inside one read transaction covering every table."""
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.execute("COMMIT")
+
     def export_data(self) -> dict:
         """Full data export."""
-        with sqlite3.connect(self.db_path) as conn:
-            districts = [District(*r) for r in conn.execute("SELECT * FROM districts").fetchall()]
-            records = [CensusRecord(*r)
-                       for r in conn.execute("SELECT * FROM census_records").fetchall()]
-        return {
-            "districts": [asdict(d) for d in districts],
-            "census_records": [asdict(r) for r in records],
-            "exported_at": datetime.now().isoformat(),
-        }
+        with self._export_snapshot() as conn:
+            data = {table: list(_iter_export_rows(conn, table)) for table in _SQL_EXPORT}
+        data["exported_at"] = datetime.now().isoformat(timespec="seconds")
+        return data
+
+    def write_export(self, fp: TextIO) -> None:
+        """Stream the full data export to ``fp`` as JSON, one row at a time."""
+        with self._export_snapshot() as conn:
+            fp.write("{\n")
+            for table in _SQL_EXPORT:
+                fp.write(f'  "{table}": [')
+                sep = "\n    "
+                for row in _iter_export_rows(conn, table):
+                    fp.write(sep + _dumps(row))
+                    sep = ",\n    "
+                fp.write("],\n" if sep == "\n    " else "\n  ],\n")
+        fp.write(f'  "exported_at": {_dumps(datetime.now().isoformat(timespec="seconds"))}\n}}\n')
+
+
+def _iter_export_rows(conn: sqlite3.Connection, table: str) -> Iterator[dict]:
+    """Yield each row of an exported table as a column-name keyed dict."""
+    cur = conn.execute(_SQL_EXPORT[table])
+    cols = [c[0] for c in cur.description]
+    for r in cur:
+        yield dict(zip(cols, r))
+
+
+def _dumps(obj) -> str:
+    """Serialise ``obj`` as compact JSON, using orjson when it is installed.
+
+    Both backends write non-ASCII text as raw UTF-8. NaN is not a concern for
+    exported rows because SQLite stores NaN as NULL.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
 
 
 def _fmt_district(d: District) -> None:
@@ -249,6 +543,8 @@ def main() -> None:
 
     ls = sub.add_parser("list", help="List districts")
     ls.add_argument("--region", default=None)
+    ls.add_argument("--limit", type=int, default=None)
+    ls.add_argument("--offset", type=int, default=0)
 
     ad = sub.add_parser("add-district", help="Register a district")
     ad.add_argument("name")
@@ -274,12 +570,17 @@ def main() -> None:
 
     args = parser.parse_args()
     ct = CensusTracker()
+    atexit.register(ct.close)
 
     if args.cmd == "list":
-        districts = ct.list_districts(args.region)
+        districts = list(ct.list_districts(args.region, args.limit, args.offset))
         label = f"region={args.region}" if args.region else "all regions"
         print(f"\n{BOLD}{BLUE}Districts ({len(districts)}) — {label}{NC}")
-        [_fmt_district(d) for d in districts] or print(f"  {YELLOW}none{NC}")
+        if districts:
+            for d in districts:
+                _fmt_district(d)
+        else:
+            print(f"  {YELLOW}none{NC}")
 
     elif args.cmd == "add-district":
         d = ct.add_district(args.name, args.region, args.area_sqkm, args.district_type)
@@ -309,7 +610,7 @@ def main() -> None:
             print(f"  {CYAN}{k}{NC}: {GREEN}{v}{NC}")
 
     elif args.cmd == "export":
-        print(json.dumps(ct.export_data(), indent=2))
+        ct.write_export(sys.stdout)
 
     else:
         parser.print_help()
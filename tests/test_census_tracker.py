@@ -0,0 +1,266 @@
+import io
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from census_tracker import SQLITE_MAX_VARIABLE_NUMBER, CensusTracker  # noqa: E402
+
+# Schema as written before timestamps moved to INTEGER epoch seconds.
+LEGACY_SCHEMA = """
+    CREATE TABLE districts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        region TEXT DEFAULT 'unknown',
+        area_sqkm REAL DEFAULT 0,
+        district_type TEXT DEFAULT 'urban',
+        created_at TEXT NOT NULL
+    );
+    CREATE TABLE census_records (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        district_id INTEGER NOT NULL REFERENCES districts(id),
+        year INTEGER NOT NULL,
+        population INTEGER DEFAULT 0,
+        households INTEGER DEFAULT 0,
+        avg_age REAL DEFAULT 0,
+        median_income REAL DEFAULT 0,
+        unemployment_rate REAL DEFAULT 0,
+        collected_at TEXT NOT NULL,
+        notes TEXT DEFAULT '',
+        UNIQUE(district_id, year)
+    );
+    CREATE INDEX idx_census_district ON census_records(district_id, year);
+"""
+
+
+SCHEMA_QUERY = (
+    "SELECT type, name, sql FROM sqlite_master"
+    " WHERE name NOT LIKE 'sqlite_stat%' ORDER BY name"
+)
+
+
+def _legacy_db(path: Path) -> Path:
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.execute(
+        "INSERT INTO districts (name,region,area_sqkm,district_type,created_at)"
+        " VALUES ('Old Town','north',4,'urban','2024-03-01T12:34:56.789012')"
+    )
+    conn.executemany(
+        "INSERT INTO census_records (district_id,year,population,households,"
+        " collected_at,notes) VALUES (1,?,?,?,?,?)",
+        [(2020, 1000, 400, "2024-03-02T08:00:00.000001", "first"),
+         (2021, 1100, 420, "2024-03-03T09:30:15.5", "second")],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    ct = CensusTracker(tmp_path / "census.db")
+    yield ct
+    ct.close()
+
+
+def test_legacy_text_timestamps_are_migrated(tmp_path):
+    ct = CensusTracker(_legacy_db(tmp_path / "legacy.db"))
+    try:
+        types = {
+            table: {r[1]: r[2] for r in ct._conn.execute(f"PRAGMA table_info({table})")}
+            for table in ("districts", "census_records")
+        }
+        assert types["districts"]["created_at"] == "INTEGER"
+        assert types["census_records"]["collected_at"] == "INTEGER"
+
+        data = ct.export_data()
+        assert data["districts"][0]["created_at"] == "2024-03-01T12:34:56"
+        assert [r["collected_at"] for r in data["census_records"]] == [
+            "2024-03-02T08:00:00", "2024-03-03T09:30:15",
+        ]
+        assert [r["notes"] for r in data["census_records"]] == ["first", "second"]
+
+        summary = ct.get_summary("Old Town")
+        assert (summary.latest_year, summary.population, summary.yoy_growth) == (2021, 1100, 10.0)
+        assert ct.record_census("Old Town", 2021, 1200).id == 2
+    finally:
+        ct.close()
+
+
+def test_migrated_export_matches_fresh_column_order(tmp_path):
+    legacy = CensusTracker(_legacy_db(tmp_path / "legacy.db"))
+    fresh = CensusTracker(tmp_path / "fresh.db")
+    try:
+        fresh.add_district("New Town")
+        fresh.record_census("New Town", 2020, 10)
+        old, new = legacy.export_data(), fresh.export_data()
+        for table in ("districts", "census_records"):
+            assert list(old[table][0]) == list(new[table][0])
+    finally:
+        legacy.close()
+        fresh.close()
+
+
+def test_migrated_schema_matches_fresh(tmp_path):
+    legacy = CensusTracker(_legacy_db(tmp_path / "legacy.db"))
+    fresh = CensusTracker(tmp_path / "fresh.db")
+    try:
+        assert (legacy._conn.execute(SCHEMA_QUERY).fetchall()
+                == fresh._conn.execute(SCHEMA_QUERY).fetchall())
+    finally:
+        legacy.close()
+        fresh.close()
+
+
+def test_unparseable_legacy_timestamp_fails_migration(tmp_path):
+    path = _legacy_db(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE census_records SET collected_at='last tuesday' WHERE year=2021")
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(ValueError, match="census_records.collected_at: 1 value"):
+        CensusTracker(path)
+
+    conn = sqlite3.connect(path)
+    try:
+        types = {r[1]: r[2] for r in conn.execute("PRAGMA table_info(census_records)")}
+        assert types["collected_at"] == "TEXT"
+        assert conn.execute(
+            "SELECT collected_at FROM census_records WHERE year=2021"
+        ).fetchone() == ("last tuesday",)
+    finally:
+        conn.close()
+
+
+def test_regional_report_density_and_growth(tracker):
+    tracker.add_district("A", "east", area_sqkm=10)
+    tracker.add_district("B", "east", area_sqkm=0)
+    tracker.add_district("C", "east", area_sqkm=5)
+    tracker.add_district("D", "east", area_sqkm=7)
+    for name, year, pop in (("A", 2020, 1000), ("A", 2021, 1200),
+                            ("B", 2019, 50), ("B", 2021, 70), ("C", 2021, 100)):
+        tracker.record_census(name, year, pop, households=pop // 2)
+
+    rpt = tracker.regional_report("east")
+    assert rpt["districts_with_data"] == 3
+    assert rpt["total_population"] == 1370
+    assert rpt["total_households"] == 685
+    # D has an area but no data, B has data but no area: both stay out of density.
+    assert rpt["density_per_sqkm"] == 86.7
+    # Only A and B have a previous census: (1200 + 70 - 1050) / 1050.
+    assert rpt["yoy_growth"] == 20.95
+
+
+def test_regional_report_empty_region(tracker):
+    assert tracker.regional_report("nowhere") == {"region": "nowhere", "districts": 0}
+
+
+def test_regional_report_region_without_census_data(tracker):
+    tracker.add_district("Quiet", "west", area_sqkm=3)
+    assert tracker.regional_report("west") == {
+        "region": "west",
+        "districts_with_data": 0,
+        "total_population": 0,
+        "total_households": 0,
+        "avg_household_size": 0,
+        "density_per_sqkm": 0,
+        "yoy_growth": 0.0,
+    }
+
+
+def _census_rows(ct):
+    return [
+        (r["district_id"], r["year"], r["population"], r["households"], r["avg_age"],
+         r["median_income"], r["unemployment_rate"], r["notes"])
+        for r in ct.export_data()["census_records"]
+    ]
+
+
+def test_record_census_bulk_last_row_wins_and_pads_defaults(tracker):
+    tracker.add_district("A")
+    tracker.add_district("B")
+    written = tracker.record_census_bulk([
+        ("A", 2020, 100, 40, 30.0, 5e4, 4.0, "first"),
+        ("B", 2020, 7),
+        ("A", 2020, 150, 60),
+    ])
+    assert written == 2
+    assert _census_rows(tracker) == [
+        (2, 2020, 7, 0, 0.0, 0.0, 0.0, ""),
+        (1, 2020, 150, 60, 0.0, 0.0, 0.0, ""),
+    ]
+
+
+@pytest.mark.parametrize("row", [("A", 2020), ("A", 2020, 1, 2, 3.0, 4.0, 5.0, "n", "extra")])
+def test_record_census_bulk_rejects_bad_row_length(tracker, row):
+    tracker.add_district("A")
+    with pytest.raises(ValueError, match="3 to 8 fields"):
+        tracker.record_census_bulk([row])
+    assert _census_rows(tracker) == []
+
+
+def test_record_census_bulk_unknown_district_writes_nothing(tracker):
+    tracker.add_district("A")
+    with pytest.raises(ValueError, match="District 'Nowhere' not found"):
+        tracker.record_census_bulk([("A", 2020, 1), ("Nowhere", 2020, 1)])
+    assert _census_rows(tracker) == []
+
+
+def test_record_census_bulk_empty_batch(tracker):
+    assert tracker.record_census_bulk([]) == 0
+
+
+def test_record_census_bulk_chunks_name_lookup(tracker):
+    names = [f"D{i}" for i in range(SQLITE_MAX_VARIABLE_NUMBER + 201)]
+    for name in names:
+        tracker.add_district(name)
+    tracker._id_cache.clear()
+    assert tracker.record_census_bulk([(n, 2020, i) for i, n in enumerate(names)]) == len(names)
+    assert tracker.status()["census_records"] == len(names)
+
+
+def test_record_census_upsert_keeps_row_id(tracker):
+    tracker.add_district("A")
+    ids = [tracker.record_census("A", year, pop).id
+           for year, pop in ((2020, 1), (2021, 2), (2021, 3))]
+    assert ids == [1, 2, 2]
+    assert tracker.get_summary("A").population == 3
+
+
+def test_list_districts_paging(tracker):
+    for i in range(5):
+        tracker.add_district(f"D{i}", region="even" if i % 2 == 0 else "odd")
+    assert [d.name for d in tracker.list_districts()] == ["D0", "D1", "D2", "D3", "D4"]
+    assert [d.name for d in tracker.list_districts(limit=2, offset=1)] == ["D1", "D2"]
+    assert [d.name for d in tracker.list_districts("even", limit=2, offset=1)] == ["D2", "D4"]
+    assert list(tracker.list_districts("none")) == []
+
+
+def test_write_export_is_valid_json(tracker):
+    out = io.StringIO()
+    tracker.write_export(out)
+    empty = json.loads(out.getvalue())
+    assert empty["districts"] == [] and empty["census_records"] == []
+
+    tracker.add_district("Zürich")
+    tracker.record_census("Zürich", 2020, 10)
+    out = io.StringIO()
+    tracker.write_export(out)
+    data = json.loads(out.getvalue())
+    assert {k: data[k] for k in ("districts", "census_records")} == {
+        k: v for k, v in tracker.export_data().items() if k != "exported_at"
+    }
+
+
+def test_close_is_idempotent(tmp_path):
+    ct = CensusTracker(tmp_path / "census.db")
+    ct.close()
+    ct.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        ct.status()